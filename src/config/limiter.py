@@ -1,9 +1,33 @@
+from limits.strategies import STRATEGIES
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
-from src.config.settings import settings
+from src.config.settings import TOKEN_BUCKET_STRATEGY, settings
+from src.config.token_bucket import TokenBucketRateLimiter
+
+# Make the Redis token bucket selectable by name, the way slowapi resolves strategies
+STRATEGIES[TOKEN_BUCKET_STRATEGY] = TokenBucketRateLimiter  # type: ignore[assignment]
+
+# Bound the startup PING (and any reconnect) so an unreachable Redis fails fast
+# instead of blocking on the OS connect timeout
+REDIS_CONNECT_TIMEOUT = 2.0
+# slowapi runs Redis commands synchronously inside the async middleware, so a Redis
+# that accepts connections but stops answering would block the event loop (and every
+# in-flight request) forever; redis-py has no command timeout by default
+REDIS_SOCKET_TIMEOUT = 1.0
 
 limiter = Limiter(
     key_func=get_remote_address,
     default_limits=[settings.rate_limiter],
+    storage_uri=settings.redis_url or "memory://",
+    strategy=settings.rate_limit_strategy,
+    # slowapi annotates the options as strings, but redis expects float timeouts
+    storage_options=(
+        {
+            "socket_connect_timeout": REDIS_CONNECT_TIMEOUT,  # type: ignore[dict-item]
+            "socket_timeout": REDIS_SOCKET_TIMEOUT,  # type: ignore[dict-item]
+        }
+        if settings.redis_url
+        else {}
+    ),
 )
@@ -1,8 +1,23 @@
-from functools import lru_cache
+from typing import Self
 
-from pydantic import field_validator
+from pydantic import PrivateAttr, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Kept as literals so importing the settings doesn't load the `limits` package;
+# `tests/test_rate_limit.py` checks they match the strategies the limiter accepts
+TOKEN_BUCKET_STRATEGY = "token-bucket"
+RATE_LIMIT_STRATEGIES = (
+    "fixed-window",
+    "moving-window",
+    "sliding-window-counter",
+    TOKEN_BUCKET_STRATEGY,
+)
+
+
+def _split_csv(value: str) -> list[str]:
+    """Split a comma-separated string into stripped, non-empty items."""
+    return list(filter(None, (item.strip() for item in value.split(","))))
+
 
 class Settings(BaseSettings):
     """
@@ -14,6 +29,10 @@ class Settings(BaseSettings):
     Attributes:
         env (str): Application environment (e.g., development, staging, production).
         rate_limiter (str): Configuration for rate limiting (e.g., "60/minute").
+        rate_limit_strategy (str): Rate limiting algorithm ("fixed-window",
+            "moving-window", "sliding-window-counter", or "token-bucket" with Redis).
+        redis_url (str | None): Redis URL for shared rate limit storage; when unset,
+            limits are kept in process memory.
         cors_origins (str): Comma-separated list of allowed CORS origins.
         cors_allow_credentials (bool): Whether to allow credentials in CORS requests.
         cors_allow_methods (str): Comma-separated list of allowed HTTP methods.
@@ -26,6 +45,8 @@ class Settings(BaseSettings):
 
     # Rate Limiting
     rate_limiter: str = "60/minute"
+    rate_limit_strategy: str = "fixed-window"
+    redis_url: str | None = None
 
     # CORS Configuration
     cors_origins: str = "*"
@@ -34,8 +55,33 @@ class Settings(BaseSettings):
     cors_allow_headers: str = "*"
     cors_max_age: int = 86400
 
+    # Parsed CORS lists, filled in by `precompute_cors_lists`
+    _cors_origins_list: list[str] = PrivateAttr(default_factory=list)
+    _cors_methods_list: list[str] = PrivateAttr(default_factory=list)
+    _cors_headers_list: list[str] = PrivateAttr(default_factory=list)
+
     model_config = SettingsConfigDict(env_file=".env")
 
+    @field_validator("rate_limit_strategy")
+    @classmethod
+    def validate_rate_limit_strategy(cls, v: str) -> str:
+        """Validate the rate limiting strategy name."""
+        if v not in RATE_LIMIT_STRATEGIES:
+            raise ValueError(
+                f"Invalid rate limit strategy: {v}. "
+                f"Must be one of {', '.join(RATE_LIMIT_STRATEGIES)}"
+            )
+        return v
+
+    @model_validator(mode="after")
+    def validate_token_bucket_storage(self) -> Self:
+        """Require Redis for the token bucket, which has no in-memory implementation."""
+        if self.rate_limit_strategy == TOKEN_BUCKET_STRATEGY and not self.redis_url:
+            raise ValueError(
+                f"Rate limit strategy {TOKEN_BUCKET_STRATEGY} requires REDIS_URL to be set"
+            )
+        return self
+
     @field_validator("cors_origins")
     @classmethod
     def validate_cors_origins(cls, v: str) -> str:
@@ -46,58 +92,72 @@ class Settings(BaseSettings):
         # Basic validation for URL format
         origins = [origin.strip() for origin in v.split(",")]
         for origin in origins:
-            if origin and not (
-                origin.startswith("http://") or origin.startswith("https://")
-            ):
+            if origin and not origin.startswith(("http://", "https://")):
                 raise ValueError(
                     f"Invalid origin format: {origin}. Must start with http:// or https://"
                 )
 
         return v
 
-    def get_cors_origins(self) -> list[str]:
-        """Get parsed CORS origins as a list."""
+    @model_validator(mode="after")
+    def precompute_cors_lists(self) -> Self:
+        """Parse the CORS settings into lists once, at construction."""
         if self.cors_origins == "*":
-            return ["*"] if self.env == "development" else []
+            self._cors_origins_list = ["*"] if self.env == "development" else []
+        else:
+            self._cors_origins_list = _split_csv(self.cors_origins)
+
+        if self.cors_allow_methods == "*":
+            self._cors_methods_list = ["*"]
+        else:
+            self._cors_methods_list = _split_csv(self.cors_allow_methods)
 
-        origins = [
-            origin.strip() for origin in self.cors_origins.split(",") if origin.strip()
-        ]
-        return origins
+        if self.cors_allow_headers == "*":
+            self._cors_headers_list = ["*"]
+        else:
+            self._cors_headers_list = _split_csv(self.cors_allow_headers)
+
+        return self
+
+    def get_cors_origins(self) -> list[str]:
+        """Get parsed CORS origins as a list (parsed at construction)."""
+        return self._cors_origins_list
 
     def get_cors_methods(self) -> list[str]:
-        """Get parsed CORS methods as a list."""
-        if self.cors_allow_methods == "*":
-            return ["*"]
-        return [
-            method.strip()
-            for method in self.cors_allow_methods.split(",")
-            if method.strip()
-        ]
+        """Get parsed CORS methods as a list (parsed at construction)."""
+        return self._cors_methods_list
 
     def get_cors_headers(self) -> list[str]:
-        """Get parsed CORS headers as a list."""
-        if self.cors_allow_headers == "*":
-            return ["*"]
-        return [
-            header.strip()
-            for header in self.cors_allow_headers.split(",")
-            if header.strip()
-        ]
+        """Get parsed CORS headers as a list (parsed at construction)."""
+        return self._cors_headers_list
+
+
+_SETTINGS: Settings | None = None
 
 
-@lru_cache
 def get_settings() -> Settings:
     """
     Retrieve the application settings instance.
 
-    This function caches the settings instance to ensure it's only initialized once (singleton),
-    improving performance and maintaining consistency across the application.
+    The settings instance is created on the first call and stored in a module global
+    (singleton), so later calls are a plain global read without cache bookkeeping.
 
     Returns:
-        Settings: The cached settings instance.
+        Settings: The shared settings instance.
     """
-    return Settings()
+    global _SETTINGS
+    if _SETTINGS is None:
+        _SETTINGS = Settings()
+    return _SETTINGS
 
 
-settings = get_settings()
+def __getattr__(name: str) -> Settings:
+    """
+    Lazily resolve the module-level `settings` attribute (PEP 562).
+
+    `from src.config.settings import settings` keeps working, but the `.env` file is
+    only read and validated on first access rather than at import time.
+    """
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,106 @@
+"""Redis-backed token bucket rate limiting strategy."""
+
+from typing import cast
+
+from limits.limits import RateLimitItem
+from limits.storage import RedisStorage, StorageTypes
+from limits.strategies import RateLimiter
+from limits.util import WindowStats
+
+# Bucket hashes live in their own namespace so they never collide with the plain
+# counters other strategies store under the same limit key (WRONGTYPE errors)
+TOKEN_BUCKET_KEY_PREFIX = "token-bucket/"
+
+# KEYS[1]: bucket key
+# ARGV[1]: capacity, ARGV[2]: refill rate (tokens/second), ARGV[3]: cost,
+# ARGV[4]: "1" to consume tokens, "0" to only test, ARGV[5]: key expiry (seconds)
+#
+# Uses the Redis server clock so every worker and replica agrees on "now".
+# Returns {allowed, remaining, reset_time}; reset_time is a string to keep the
+# fractional part, which Redis would otherwise truncate.
+TOKEN_BUCKET_LUA = b"""
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local clock = redis.call("TIME")
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "ts")
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+if tokens < cost then
+    return {0, math.floor(tokens), tostring(now + (cost - tokens) / rate)}
+end
+
+if ARGV[4] == "1" then
+    tokens = tokens - cost
+    redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "ts", tostring(now))
+    redis.call("EXPIRE", KEYS[1], ARGV[5])
+end
+
+return {1, math.floor(tokens), tostring(now + (capacity - tokens) / rate)}
+"""
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    """
+    Token bucket rate limiter evaluated atomically in Redis.
+
+    Each limit maps to a bucket holding up to `amount` tokens that refills
+    continuously over the limit's window. Every check is a single `EVALSHA`
+    round trip, so limits stay consistent across workers and replicas.
+
+    The reported reset time is when the bucket is full again, or, once the
+    bucket is exhausted, when enough tokens are available for the next hit.
+    """
+
+    def __init__(self, storage: StorageTypes) -> None:
+        if not isinstance(storage, RedisStorage):
+            raise NotImplementedError(
+                "TokenBucketRateLimiter is not implemented for storage "
+                f"of type {storage.__class__}"
+            )
+        super().__init__(storage)
+        self._script = storage.get_connection().register_script(TOKEN_BUCKET_LUA)
+
+    def _bucket_key(self, item: RateLimitItem, identifiers: tuple[str, ...]) -> str:
+        """Build the Redis key of the bucket for a limit and its identifiers."""
+        storage = cast(RedisStorage, self.storage)
+        return storage.prefixed_key(
+            TOKEN_BUCKET_KEY_PREFIX + item.key_for(*identifiers)
+        )
+
+    def _evaluate(
+        self,
+        item: RateLimitItem,
+        identifiers: tuple[str, ...],
+        cost: int,
+        consume: bool,
+    ) -> tuple[bool, int, float]:
+        """Run the token bucket script and return (allowed, remaining, reset_time)."""
+        expiry = item.get_expiry()
+        allowed, remaining, reset_time = self._script(
+            keys=[self._bucket_key(item, identifiers)],
+            args=[item.amount, item.amount / expiry, cost, int(consume), expiry],
+        )
+        return bool(allowed), int(remaining), float(reset_time)
+
+    def hit(self, item: RateLimitItem, *identifiers: str, cost: int = 1) -> bool:
+        """Consume `cost` tokens from the bucket if they are available."""
+        return self._evaluate(item, identifiers, cost, consume=True)[0]
+
+    def test(self, item: RateLimitItem, *identifiers: str, cost: int = 1) -> bool:
+        """Check whether `cost` tokens are available without consuming them."""
+        return self._evaluate(item, identifiers, cost, consume=False)[0]
+
+    def get_window_stats(self, item: RateLimitItem, *identifiers: str) -> WindowStats:
+        """Report the bucket's reset time and remaining tokens."""
+        _, remaining, reset_time = self._evaluate(item, identifiers, 1, consume=False)
+        return WindowStats(reset_time, remaining)
+
+    def clear(self, item: RateLimitItem, *identifiers: str) -> None:
+        """Reset the bucket so it starts full again."""
+        storage = cast(RedisStorage, self.storage)
+        storage.get_connection().delete(self._bucket_key(item, identifiers))
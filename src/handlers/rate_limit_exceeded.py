@@ -1,13 +1,27 @@
+import json
 import logging
+from typing import cast
 
 from fastapi import Request, Response
+from slowapi import Limiter
 from slowapi.errors import RateLimitExceeded
-from starlette.responses import JSONResponse
+from slowapi.wrappers import Limit
 
 from src.schemas import RateLimitExceededResponse
 
 logger = logging.getLogger(__name__)
 
+# Serialized RateLimitExceededResponse with a %d slot for retry_after_seconds.
+# Only the retry value varies, so the body is formatted instead of validated and
+# dumped by Pydantic on every rejection. The schema remains the source of truth.
+_429_TEMPLATE = (
+    b'{"detail":'
+    + json.dumps(RateLimitExceededResponse.model_fields["detail"].default)
+    .encode()
+    .replace(b"%", b"%%")
+    + b',"retry_after_seconds":%d}'
+)
+
 
 def rate_limit_exceeded_handler(request: Request, exc: Exception) -> Response:
     """
@@ -25,29 +39,25 @@ def rate_limit_exceeded_handler(request: Request, exc: Exception) -> Response:
         Response: A JSON response with status code 429, a Retry-After header,
                   and a detailed message in the body.
     """
-    if isinstance(exc, RateLimitExceeded):
+    if not isinstance(exc, RateLimitExceeded):
+        raise exc
+
+    if logger.isEnabledFor(logging.INFO):
         client_host = request.client.host if request.client is not None else "unknown"
         logger.info("Rate limiter triggered by %s", client_host)
 
-        retry_after_seconds = getattr(
-            getattr(getattr(exc, "limit", None), "GRANULARITY", None), "seconds", 1
-        )
-
-        response_body = RateLimitExceededResponse(
-            retry_after_seconds=retry_after_seconds
-        )
-
-        response = JSONResponse(
-            status_code=429,
-            content=response_body.model_dump(),
-            headers={"Retry-After": str(retry_after_seconds)},
-        )
-
-        if hasattr(request.app.state.limiter, "inject_headers"):
-            response = request.app.state.limiter.inject_headers(
-                response, request.state.view_rate_limit
-            )
-
-        return response
-    else:
-        raise exc
+    # slowapi's `Limit` wrapper holds the parsed limit (e.g. "60/minute") in `.limit`;
+    # its expiry is the full window length, granularity times multiples
+    retry_after_seconds = cast(Limit, exc.limit).limit.get_expiry()
+
+    response = Response(
+        content=_429_TEMPLATE % retry_after_seconds,
+        status_code=429,
+        media_type="application/json",
+        headers={"Retry-After": str(retry_after_seconds)},
+    )
+
+    # Adds the X-RateLimit-* headers when the limiter has `headers_enabled`
+    limiter: Limiter = request.app.state.limiter
+    response = limiter._inject_headers(response, request.state.view_rate_limit)
+    return response
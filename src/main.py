@@ -1,15 +1,17 @@
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Any
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
 from starlette.middleware.cors import CORSMiddleware
 
 from src.config.limiter import limiter
 from src.config.settings import settings
 from src.handlers.rate_limit_exceeded import rate_limit_exceeded_handler
+from src.middleware.rate_limit import RateLimitMiddleware
 from src.routers import health
 
 # Configure logging
@@ -20,23 +22,35 @@ logging.basicConfig(
 # Create a logger
 logger = logging.getLogger(__name__)
 
+# CORS configuration, resolved once and shared by the middleware and startup log
+cors_config: dict[str, Any] = {
+    "allow_origins": settings.get_cors_origins(),
+    "allow_credentials": settings.cors_allow_credentials,
+    "allow_methods": settings.get_cors_methods(),
+    "allow_headers": settings.get_cors_headers(),
+    "max_age": settings.cors_max_age,
+}
+
 
 @asynccontextmanager
 async def lifespan(app_instance: FastAPI) -> AsyncGenerator[None]:
     """Manage application lifespan events."""
     # Startup
     logger.info("🚀 Starting %s", app_instance.title)
-    logger.info("Environment: %s", settings.env)
-    logger.info("CORS Origins: %s", settings.get_cors_origins())
-    logger.info("CORS Methods: %s", settings.get_cors_methods())
-    logger.info("CORS Headers: %s", settings.get_cors_headers())
-    logger.info("CORS Allow Credentials: %s", settings.cors_allow_credentials)
-    logger.info("CORS Max Age: %s seconds", settings.cors_max_age)
-    logger.info("Rate Limiter: %s", settings.rate_limiter)
     logger.info(
-        "Documentation URL: %s",
-        "/docs" if settings.env == "development" else "disabled",
+        "Configuration: %s",
+        {
+            "env": settings.env,
+            "cors": cors_config,
+            "rate_limiter": settings.rate_limiter,
+            "rate_limit_strategy": settings.rate_limit_strategy,
+            "rate_limit_storage": "redis" if settings.redis_url else "memory",
+            "docs_url": app_instance.docs_url or "disabled",
+        },
     )
+    # Fail fast instead of erroring on every limited request when Redis is down
+    if settings.redis_url and not limiter.limiter.storage.check():
+        raise RuntimeError("Rate limit storage is unreachable, check REDIS_URL")
     logger.info("✅ Application startup complete")
 
     yield
@@ -52,28 +66,21 @@ app = FastAPI(
     """,
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     redoc_url=None,
     docs_url="/docs" if settings.env == "development" else None,
 )
 
-# Add CORS middleware with environment-specific configuration
-cors_origins = settings.get_cors_origins()
-cors_methods = settings.get_cors_methods()
-cors_headers = settings.get_cors_headers()
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=cors_origins,
-    allow_credentials=settings.cors_allow_credentials,
-    allow_methods=cors_methods,
-    allow_headers=cors_headers,
-    max_age=settings.cors_max_age,
-)
+# Add CORS middleware with environment-specific configuration (resolved above).
+# Skipped entirely when no origin is allowed, so pure backend APIs don't pay for
+# CORS header inspection on every request.
+if cors_config["allow_origins"]:
+    app.add_middleware(CORSMiddleware, **cors_config)
 
 # Add the Limiter middleware with the custom handler
 app.state.limiter = limiter
-app.add_middleware(SlowAPIMiddleware)
+app.add_middleware(RateLimitMiddleware)
 app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
 
 # Add API routes
-app.include_router(health.router, prefix="/api/v1", tags=["Health"])
+app.include_router(health.router, prefix="/api/v1")
@@ -0,0 +1,147 @@
+"""
+Rate limit middleware built on slowapi's helpers.
+
+This module relies on slowapi 0.1.9 internals, which are private and may change
+without notice: `slowapi.middleware._should_exempt`, `async_check_limits`,
+`Limiter._exempt_routes`, `Limiter._route_limits` and
+`Limiter._inject_asgi_headers`. `tests/test_rate_limit.py::test_slowapi_internals`
+fails when their shape changes; re-check this module before bumping slowapi.
+"""
+
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from slowapi import Limiter
+from slowapi.middleware import _should_exempt, async_check_limits
+from starlette.applications import Starlette
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.routing import BaseRoute, Match, Route
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+def _resolve_route(routes: list[BaseRoute], scope: Scope) -> BaseRoute | None:
+    """Return the route the router dispatches `scope` to, i.e. the first full match."""
+    for route in routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route
+    return None
+
+
+def _probe_scope(method: str, path: str) -> Scope:
+    """Build a minimal request scope for matching routes without a real request."""
+    # Routes such as `Host` read the headers, so every key they inspect must exist
+    return {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+    }
+
+
+def get_exempt_routes(app: Starlette, limiter: Limiter) -> frozenset[tuple[str, str]]:
+    """
+    Collect the `(method, path)` pairs served by routes decorated with `@limiter.exempt`.
+
+    Routes with path parameters are left out, since they can't be matched by a
+    plain string lookup; they are still resolved and exempted per request. A
+    pair is only kept when the exempt route is the one the router dispatches it
+    to, so an earlier limited route (e.g. `/items/{item_id}` shadowing
+    `/items/special`) keeps being rate limited.
+    """
+    routes = app.routes
+    exempt_routes: set[tuple[str, str]] = set()
+    for route in routes:
+        if (
+            not isinstance(route, Route)
+            or route.methods is None
+            or "{" in route.path
+            or f"{route.endpoint.__module__}.{route.endpoint.__name__}"
+            not in limiter._exempt_routes
+        ):
+            continue
+
+        exempt_routes.update(
+            (method, route.path)
+            for method in route.methods
+            if _resolve_route(routes, _probe_scope(method, route.path)) is route
+        )
+    return frozenset(exempt_routes)
+
+
+class RateLimitMiddleware:
+    """
+    Pure ASGI rate limit middleware that bypasses slowapi for exempt routes.
+
+    `SlowAPIASGIMiddleware` resolves the route handler for every request just to
+    discover it is exempt. Requests to exempt routes (e.g. health probes) are
+    passed straight to the application instead, with zero rate limiting work.
+    The exempt routes are collected on the first request, once all routes exist,
+    and collected again whenever the number of routes changes. Replacing a route
+    in place isn't detected.
+
+    Other requests are checked with slowapi's helpers, but against the route the
+    router actually dispatches to: slowapi picks the *last* matching route, which
+    lets an exempt route exempt a limited route declared before it.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.exempt_routes: frozenset[tuple[str, str]] = frozenset()
+        self.route_count: int | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        app: Starlette = scope["app"]
+        limiter: Limiter = app.state.limiter
+        if self.route_count != len(app.routes):
+            self.route_count = len(app.routes)
+            try:
+                self.exempt_routes = get_exempt_routes(app, limiter)
+            except Exception:
+                # Without the shortcut every request is still resolved and checked
+                logger.exception("Failed to collect rate limit exempt routes")
+                self.exempt_routes = frozenset()
+
+        if (
+            not limiter.enabled
+            or (scope["method"], scope["path"]) in self.exempt_routes
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        route = _resolve_route(app.routes, scope)
+        handler: Callable[..., Any] | None = getattr(route, "endpoint", None)
+        if _should_exempt(limiter, handler):
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive=receive, send=send)
+        error_response, should_inject_headers = await async_check_limits(
+            limiter, request, handler, app
+        )
+        if error_response is not None:
+            await error_response(scope, receive, send)
+            return
+
+        if not should_inject_headers:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                limiter._inject_asgi_headers(
+                    MutableHeaders(scope=message), request.state.view_rate_limit
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
@@ -1,31 +1,53 @@
 import logging
+import time
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import ORJSONResponse
 
 from src.config.limiter import limiter
 from src.schemas import HealthResponse
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(
+    prefix="/health", tags=["Health"], default_response_class=ORJSONResponse
+)
 
+# Seconds a serialized health response is reused before it is rebuilt
+_CACHE_TTL = 1.0
 
-@router.get("/health", response_model=HealthResponse)
+# Monotonic build time and serialized body of the last health response
+_CACHE: tuple[float, bytes] = (float("-inf"), b"")
+
+
+@router.get("", response_model=HealthResponse)
 @limiter.exempt  # type: ignore[misc]
-async def health(request: Request) -> HealthResponse:
+async def health(request: Request) -> Response:
     """
     Health check endpoint.
 
     Returns a 200 OK response with application health status.
     Logs the client host making the request.
 
+    The serialized response is cached for `_CACHE_TTL` seconds, so frequent
+    load balancer probes reuse the same body instead of rebuilding it.
+
     Args:
         request (Request): The incoming HTTP request object.
 
     Returns:
-        HealthResponse: A response containing health status information.
+        Response: A JSON response containing health status information.
     """
-    client_host = request.client.host if request.client else "unknown"
-    logger.info("Health check request from %s", client_host)
+    global _CACHE
+
+    if logger.isEnabledFor(logging.INFO):
+        client_host = request.client.host if request.client else "unknown"
+        logger.info("Health check request from %s", client_host)
+
+    now = time.monotonic()
+    built_at, body = _CACHE
+    if now - built_at >= _CACHE_TTL:
+        body = HealthResponse().model_dump_json().encode()
+        _CACHE = (now, body)
 
-    return HealthResponse()
+    return Response(content=body, media_type="application/json")
@@ -1,8 +1,10 @@
 """Tests for CORS configuration."""
 
 import pytest
+from fastapi.testclient import TestClient
 
 from src.config.settings import Settings
+from src.main import app
 from src.utils.cors import is_cors_secure, parse_cors_origins, validate_origin
 
 
@@ -14,11 +16,26 @@ def test_validate_origin():
     assert validate_origin("http://localhost:3000") is True
     assert validate_origin("https://subdomain.example.com") is True
     assert validate_origin("https://example.com:8080") is True
+    assert validate_origin("https://bücher.example") is True
+    assert validate_origin("http://127.0.0.1:3000") is True
+    assert validate_origin("https://my-app.example.com/") is True
 
     # Invalid origins
     assert validate_origin("invalid-url") is False
     assert validate_origin("ftp://example.com") is False
     assert validate_origin("") is False
+    assert validate_origin("https://") is False
+    assert validate_origin("https://example.com:port") is False
+    assert validate_origin("http://exa mple.com") is False
+    assert validate_origin("https://user:pw@example.com") is False
+    assert validate_origin("https://example.com#x") is False
+    assert validate_origin("https://.") is False
+    assert validate_origin("https://exa_mple.com") is False
+    assert validate_origin("https://example.com:") is False
+    assert validate_origin("https://a..b.com") is False
+    assert validate_origin("https://-example.com") is False
+    assert validate_origin("https://example.com.") is False
+    assert validate_origin("https://" + "a" * 64 + ".com") is False
 
 
 def test_parse_cors_origins():
@@ -113,6 +130,18 @@ def test_settings_cors_headers():
     assert headers_wildcard == ["*"]
 
 
+def test_settings_cors_lists_cached():
+    """Test parsed CORS lists are computed once per settings instance."""
+    settings = Settings(
+        cors_origins="https://app.com",
+        cors_allow_methods="GET,POST",
+        cors_allow_headers="Authorization",
+    )
+    assert settings.get_cors_origins() is settings.get_cors_origins()
+    assert settings.get_cors_methods() is settings.get_cors_methods()
+    assert settings.get_cors_headers() is settings.get_cors_headers()
+
+
 def test_cors_origins_validation_error():
     """Test CORS origins validation errors."""
     with pytest.raises(ValueError, match="Invalid origin format"):
@@ -165,3 +194,17 @@ def test_cors_configuration_integration():
 
     # Verify security
     assert is_cors_secure(origins, settings.env) is True
+
+
+def test_cors_preflight_development():
+    """Test the CORS middleware answers preflight requests in development."""
+    client = TestClient(app)
+    response = client.options(
+        "/api/v1/health",
+        headers={
+            "Origin": "https://example.com",
+            "Access-Control-Request-Method": "GET",
+        },
+    )
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "https://example.com"
@@ -3,6 +3,7 @@ from datetime import datetime
 from fastapi.testclient import TestClient
 
 from src.main import app
+from src.routers import health
 
 client = TestClient(app)
 
@@ -15,3 +16,15 @@ def test_health():
     assert "timestamp" in data
     # Verify timestamp is in ISO format
     datetime.fromisoformat(data["timestamp"].replace("Z", "+00:00"))
+
+
+def test_health_cached(monkeypatch):
+    # Widen the cache window so both requests are guaranteed to fall inside it
+    monkeypatch.setattr(health, "_CACHE_TTL", 60.0)
+
+    first = client.get("/api/v1/health")
+    second = client.get("/api/v1/health")
+    assert second.status_code == 200
+    assert second.headers["content-type"] == "application/json"
+    # Responses within the cache window reuse the same serialized body
+    assert second.content == first.content
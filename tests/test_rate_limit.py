@@ -0,0 +1,268 @@
+"""Tests for rate limiting."""
+
+import inspect
+
+import pytest
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from limits.storage import RedisStorage
+from limits.strategies import STRATEGIES
+from slowapi import Limiter
+from slowapi.errors import RateLimitExceeded
+from slowapi.middleware import _should_exempt, async_check_limits
+from slowapi.util import get_remote_address
+
+from src.config.limiter import REDIS_CONNECT_TIMEOUT, REDIS_SOCKET_TIMEOUT, limiter
+from src.config.settings import RATE_LIMIT_STRATEGIES, Settings, get_settings
+from src.handlers.rate_limit_exceeded import rate_limit_exceeded_handler
+from src.middleware import rate_limit
+from src.middleware.rate_limit import RateLimitMiddleware, get_exempt_routes
+from src.schemas import RateLimitExceededResponse
+
+
+def create_limited_app(headers_enabled: bool = False) -> FastAPI:
+    """Build an app allowing a single request per minute."""
+    app = FastAPI()
+    limiter = Limiter(
+        key_func=get_remote_address,
+        default_limits=["1/minute"],
+        headers_enabled=headers_enabled,
+    )
+    app.state.limiter = limiter
+    app.add_middleware(RateLimitMiddleware)
+    app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
+
+    @app.get("/limited")
+    async def limited() -> dict[str, str]:
+        return {"status": "ok"}
+
+    @app.get("/unlimited")
+    @limiter.exempt
+    async def unlimited() -> dict[str, str]:
+        return {"status": "ok"}
+
+    return app
+
+
+def create_limited_client() -> TestClient:
+    return TestClient(create_limited_app())
+
+
+def test_rate_limit_exceeded():
+    """Test the 429 response once the limit is exhausted."""
+    client = create_limited_client()
+
+    assert client.get("/limited").status_code == 200
+
+    response = client.get("/limited")
+    assert response.status_code == 429
+    assert response.headers["content-type"] == "application/json"
+
+    # The pre-serialized body must still match the response schema
+    data = RateLimitExceededResponse.model_validate_json(response.content).model_dump()
+    assert data["detail"] == "Rate limit exceeded. Please try again later."
+    assert response.headers["Retry-After"] == str(data["retry_after_seconds"])
+    # The full window of the "1/minute" limit, not a 1 second fallback
+    assert data["retry_after_seconds"] == 60
+
+
+def test_rate_limit_exceeded_repeated():
+    """Test repeated rejections return the same response."""
+    client = create_limited_client()
+    client.get("/limited")
+
+    first = client.get("/limited")
+    second = client.get("/limited")
+    assert second.status_code == 429
+    assert second.content == first.content
+    assert second.headers["Retry-After"] == first.headers["Retry-After"]
+
+
+def test_rate_limit_exceeded_headers():
+    """Test the 429 response carries X-RateLimit-* headers when enabled."""
+    client = TestClient(create_limited_app(headers_enabled=True))
+    client.get("/limited")
+
+    response = client.get("/limited")
+    assert response.status_code == 429
+    assert response.headers["X-RateLimit-Limit"] == "1"
+    assert response.headers["X-RateLimit-Remaining"] == "0"
+    assert "X-RateLimit-Reset" in response.headers
+    assert 0 < int(response.headers["Retry-After"]) <= 60
+
+
+def test_rate_limit_strategy():
+    """Test rate limit strategy configuration."""
+    assert Settings().rate_limit_strategy == "fixed-window"
+    assert Settings(rate_limit_strategy="moving-window").rate_limit_strategy == (
+        "moving-window"
+    )
+    token_bucket = Settings(
+        rate_limit_strategy="token-bucket", redis_url="redis://localhost:6379/0"
+    )
+    assert token_bucket.rate_limit_strategy == "token-bucket"
+
+    with pytest.raises(ValueError, match="requires REDIS_URL"):
+        Settings(rate_limit_strategy="token-bucket")
+
+    with pytest.raises(ValueError, match="Invalid rate limit strategy"):
+        Settings(rate_limit_strategy="leaky-bucket")
+
+
+def test_rate_limit_strategies_registered():
+    """Test the strategy names accepted by Settings match the limiter's registry."""
+    assert sorted(RATE_LIMIT_STRATEGIES) == sorted(STRATEGIES)
+
+
+def test_exempt_routes():
+    """Test exempt routes bypass the limiter entirely."""
+    app = create_limited_app()
+    assert get_exempt_routes(app, app.state.limiter) == frozenset(
+        {("GET", "/unlimited")}
+    )
+
+    client = TestClient(app)
+    for _ in range(3):
+        assert client.get("/unlimited").status_code == 200
+    assert client.get("/limited").status_code == 200
+    assert client.get("/limited").status_code == 429
+
+
+def test_exempt_routes_method():
+    """Test exempting one method leaves other methods on the same path limited."""
+    app = create_limited_app()
+    limiter = app.state.limiter
+
+    @app.get("/items")
+    @limiter.exempt
+    async def list_items() -> dict[str, str]:
+        return {"status": "ok"}
+
+    @app.post("/items")
+    async def create_item() -> dict[str, str]:
+        return {"status": "ok"}
+
+    client = TestClient(app)
+    assert client.get("/items").status_code == 200
+    assert client.post("/items").status_code == 200
+    assert client.post("/items").status_code == 429
+    assert client.get("/items").status_code == 200
+
+
+def test_exempt_routes_shadowed():
+    """Test an exempt path shadowed by an earlier limited route stays limited."""
+    app = create_limited_app()
+    limiter = app.state.limiter
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: str) -> dict[str, str]:
+        return {"item_id": item_id}
+
+    @app.get("/items/special")
+    @limiter.exempt
+    async def get_special_item() -> dict[str, str]:
+        return {"item_id": "special"}
+
+    assert get_exempt_routes(app, limiter) == frozenset({("GET", "/unlimited")})
+
+    client = TestClient(app)
+    assert client.get("/items/special").status_code == 200
+    assert client.get("/items/special").status_code == 429
+
+
+def test_exempt_routes_host_route():
+    """Test a header-matched route before an exempt route doesn't break the bypass."""
+    app = create_limited_app()
+    limiter = app.state.limiter
+    app.host("admin.example.com", FastAPI())
+
+    @app.get("/ex")
+    @limiter.exempt
+    async def exempt() -> dict[str, str]:
+        return {"status": "ok"}
+
+    assert ("GET", "/ex") in get_exempt_routes(app, limiter)
+
+    client = TestClient(app)
+    for _ in range(3):
+        assert client.get("/ex").status_code == 200
+    assert client.get("/limited").status_code == 200
+    assert client.get("/limited").status_code == 429
+
+
+def test_exempt_routes_recollected():
+    """Test routes added after the first request are taken into account."""
+    app = create_limited_app()
+    client = TestClient(app)
+    assert client.get("/unlimited").status_code == 200
+
+    async def shadow() -> dict[str, str]:
+        return {"status": "shadowed"}
+
+    # A limited route inserted ahead of the exempt one now handles its path
+    app.router.routes.insert(0, APIRoute("/unlimited", shadow))
+    assert client.get("/unlimited").status_code == 200
+    assert client.get("/unlimited").status_code == 429
+
+
+def test_exempt_routes_precompute_failure(monkeypatch):
+    """Test a failing exempt route precompute falls back to per-request checks."""
+
+    def broken_exempt_routes(*args: object) -> frozenset[tuple[str, str]]:
+        raise KeyError("headers")
+
+    monkeypatch.setattr(rate_limit, "get_exempt_routes", broken_exempt_routes)
+    client = create_limited_client()
+
+    for _ in range(3):
+        assert client.get("/unlimited").status_code == 200
+    assert client.get("/limited").status_code == 200
+    assert client.get("/limited").status_code == 429
+
+
+def test_slowapi_internals():
+    """Test the slowapi internals the middleware relies on keep their shape."""
+    assert list(inspect.signature(_should_exempt).parameters) == ["limiter", "handler"]
+    assert list(inspect.signature(async_check_limits).parameters) == [
+        "limiter",
+        "request",
+        "handler",
+        "app",
+    ]
+    assert inspect.iscoroutinefunction(async_check_limits)
+    assert list(inspect.signature(Limiter._inject_asgi_headers).parameters) == [
+        "self",
+        "headers",
+        "current_limit",
+    ]
+    assert list(inspect.signature(Limiter._inject_headers).parameters) == [
+        "self",
+        "response",
+        "current_limit",
+    ]
+
+    limiter = Limiter(key_func=get_remote_address)
+    assert isinstance(limiter._exempt_routes, set)
+    assert isinstance(limiter._route_limits, dict)
+
+
+def test_startup_redis_unreachable(monkeypatch):
+    """Test startup fails fast when the configured Redis can't be reached."""
+    from src.main import app
+
+    redis_url = "redis://127.0.0.1:1/0"
+    monkeypatch.setattr(get_settings(), "redis_url", redis_url)
+    monkeypatch.setattr(
+        limiter.limiter,
+        "storage",
+        RedisStorage(
+            redis_url,
+            socket_connect_timeout=REDIS_CONNECT_TIMEOUT,
+            socket_timeout=REDIS_SOCKET_TIMEOUT,
+        ),
+    )
+
+    with pytest.raises(RuntimeError, match="REDIS_URL"):
+        with TestClient(app):
+            pass
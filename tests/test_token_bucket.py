@@ -0,0 +1,102 @@
+"""Tests for the Redis token bucket rate limiting strategy."""
+
+import time
+
+import fakeredis
+import pytest
+from limits import parse
+from limits.storage import MemoryStorage, RedisStorage
+
+from src.config.token_bucket import TokenBucketRateLimiter
+
+
+class StubScript:
+    """Stand-in for a registered Lua script that records its calls."""
+
+    def __init__(self, result: list[object]) -> None:
+        self.result = result
+        self.calls: list[dict[str, list[object]]] = []
+
+    def __call__(self, keys: list[str], args: list[object]) -> list[object]:
+        self.calls.append({"keys": keys, "args": args})
+        return self.result
+
+
+def create_stubbed_limiter(result: list[object]) -> TokenBucketRateLimiter:
+    """Build a limiter whose Lua script is replaced by a stub."""
+    # Registering scripts does not connect, so no Redis server is needed here
+    limiter = TokenBucketRateLimiter(RedisStorage("redis://localhost:6379"))
+    limiter._script = StubScript(result)  # type: ignore[assignment]
+    return limiter
+
+
+def test_requires_redis_storage():
+    """Test the token bucket refuses non-Redis storage."""
+    with pytest.raises(NotImplementedError, match="MemoryStorage"):
+        TokenBucketRateLimiter(MemoryStorage())
+
+
+def test_hit_arguments():
+    """Test hit() passes capacity, refill rate, cost and consume flag."""
+    limiter = create_stubbed_limiter([1, 9, b"1700000000.5"])
+    item = parse("10/minute")
+
+    assert limiter.hit(item, "client", "endpoint", cost=2) is True
+
+    (call,) = limiter._script.calls  # type: ignore[attr-defined]
+    assert call["keys"] == ["LIMITS:token-bucket/" + item.key_for("client", "endpoint")]
+    assert call["args"] == [10, 10 / 60, 2, 1, 60]
+
+
+def test_test_and_window_stats():
+    """Test test() and get_window_stats() peek without consuming."""
+    limiter = create_stubbed_limiter([0, 0, b"1700000000.25"])
+    item = parse("5/second")
+
+    assert limiter.test(item, "client") is False
+    assert limiter.get_window_stats(item, "client") == (1700000000.25, 0)
+
+    calls = limiter._script.calls  # type: ignore[attr-defined]
+    assert [call["args"][2:4] for call in calls] == [[1, 0], [1, 0]]
+
+
+@pytest.fixture
+def redis_limiter() -> TokenBucketRateLimiter:
+    """Token bucket backed by fakeredis with Lua support."""
+    storage = RedisStorage("redis://localhost:6379")
+    storage.storage = fakeredis.FakeRedis()
+    return TokenBucketRateLimiter(storage)
+
+
+def test_bucket_refill_and_deny(redis_limiter):
+    """Test the Lua script drains, denies and refills the bucket."""
+    item = parse("3/second")
+
+    assert [redis_limiter.hit(item, "client") for _ in range(4)] == [
+        True,
+        True,
+        True,
+        False,
+    ]
+
+    reset_time, remaining = redis_limiter.get_window_stats(item, "client")
+    assert remaining == 0
+    assert reset_time > time.time()
+
+    # One token refills every third of a second
+    time.sleep(0.4)
+    assert redis_limiter.hit(item, "client") is True
+    assert redis_limiter.hit(item, "client") is False
+
+
+def test_bucket_key_namespace(redis_limiter):
+    """Test buckets don't collide with counters stored under the limit key."""
+    item = parse("2/minute")
+    connection = redis_limiter.storage.storage
+
+    # A fixed-window counter left behind under the plain limit key
+    connection.set(redis_limiter.storage.prefixed_key(item.key_for("client")), 5)
+    assert redis_limiter.hit(item, "client") is True
+
+    redis_limiter.clear(item, "client")
+    assert connection.exists(redis_limiter._bucket_key(item, ("client",))) == 0